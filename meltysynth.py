@@ -1,50 +1,117 @@
+import functools
 import io
 import itertools
 import math
+import mmap
+import operator
+import struct
+import sys
 
 from array import array
 from collections.abc import MutableSequence, Sequence
 from enum import IntEnum
 from io import BufferedIOBase
-from typing import Optional
+from typing import Any, Optional, TypeVar, cast
 
 
 def create_buffer(length: int) -> MutableSequence[float]:
-    return array("d", itertools.repeat(0, length))
+    # Zero bytes are read as zeros, so no per-element initialization is needed.
+    return array("d", bytes(8 * length))
+
+
+class _MemoryReader:
+    __slots__ = ("_data", "_position")
+
+    _data: memoryview
+    _position: int
+
+    def __init__(self, data: bytes | bytearray | memoryview | mmap.mmap) -> None:
+        self._data = memoryview(data)
+        self._position = 0
+
+    def read(self, size: int) -> memoryview:
+        start = self._position
+        self._position = min(start + size, len(self._data))
+
+        # Slicing a memoryview does not copy the underlying data.
+        return self._data[start : self._position]
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        match whence:
+            case io.SEEK_SET:
+                self._position = offset
+            case io.SEEK_CUR:
+                self._position += offset
+
+        return self._position
 
 
 class _BinaryReaderEx:
+    _INT32 = struct.Struct("<i")
+    _UINT32 = struct.Struct("<I")
+    _INT16 = struct.Struct("<h")
+    _UINT16 = struct.Struct("<H")
+    _INT8 = struct.Struct("<b")
+    _INT32_BIG_ENDIAN = struct.Struct(">i")
+    _INT16_BIG_ENDIAN = struct.Struct(">h")
+    _CHUNK_HEADER = struct.Struct("<4sI")
+
+    # Maps non-printable characters to '?'.
+    _PRINTABLE = bytes(value if 32 <= value <= 126 else 63 for value in range(256))
+
+    @staticmethod
+    def read_exactly(reader: BufferedIOBase, size: int) -> bytes:
+        # A short read means the file is truncated.
+        data = reader.read(size)
+        if len(data) != size:
+            raise Exception("The data ended unexpectedly.")
+        return data
+
     @staticmethod
     def read_int32(reader: BufferedIOBase) -> int:
-        return int.from_bytes(reader.read(4), byteorder="little", signed=True)
+        data = _BinaryReaderEx.read_exactly(reader, 4)
+        return _BinaryReaderEx._INT32.unpack(data)[0]
 
     @staticmethod
     def read_uint32(reader: BufferedIOBase) -> int:
-        return int.from_bytes(reader.read(4), byteorder="little", signed=False)
+        data = _BinaryReaderEx.read_exactly(reader, 4)
+        return _BinaryReaderEx._UINT32.unpack(data)[0]
 
     @staticmethod
     def read_int16(reader: BufferedIOBase) -> int:
-        return int.from_bytes(reader.read(2), byteorder="little", signed=True)
+        data = _BinaryReaderEx.read_exactly(reader, 2)
+        return _BinaryReaderEx._INT16.unpack(data)[0]
 
     @staticmethod
     def read_uint16(reader: BufferedIOBase) -> int:
-        return int.from_bytes(reader.read(2), byteorder="little", signed=False)
+        data = _BinaryReaderEx.read_exactly(reader, 2)
+        return _BinaryReaderEx._UINT16.unpack(data)[0]
 
     @staticmethod
     def read_int8(reader: BufferedIOBase) -> int:
-        return int.from_bytes(reader.read(1), byteorder="little", signed=True)
+        data = _BinaryReaderEx.read_exactly(reader, 1)
+        return _BinaryReaderEx._INT8.unpack(data)[0]
 
     @staticmethod
     def read_uint8(reader: BufferedIOBase) -> int:
-        return int.from_bytes(reader.read(1), byteorder="little", signed=False)
+        # Checked inline, as this is called for every byte of a MIDI event.
+        data = reader.read(1)
+        if not data:
+            raise Exception("The data ended unexpectedly.")
+        return data[0]
 
     @staticmethod
     def read_int32_big_endian(reader: BufferedIOBase) -> int:
-        return int.from_bytes(reader.read(4), byteorder="big", signed=True)
+        data = _BinaryReaderEx.read_exactly(reader, 4)
+        return _BinaryReaderEx._INT32_BIG_ENDIAN.unpack(data)[0]
 
     @staticmethod
     def read_int16_big_endian(reader: BufferedIOBase) -> int:
-        return int.from_bytes(reader.read(2), byteorder="big", signed=True)
+        data = _BinaryReaderEx.read_exactly(reader, 2)
+        return _BinaryReaderEx._INT16_BIG_ENDIAN.unpack(data)[0]
 
     @staticmethod
     def read_int_variable_length(reader: BufferedIOBase) -> int:
@@ -65,39 +132,60 @@ class _BinaryReaderEx:
         return acc
 
     @staticmethod
-    def read_four_cc(reader: BufferedIOBase) -> str:
-        data = bytearray(reader.read(4))
+    def read_four_cc(reader: BufferedIOBase) -> bytes:
+        # The tag is kept as raw bytes, which are cheap to compare and hash.
+        # A short tag matches no chunk ID, so the caller reports it instead.
+        return bytes(reader.read(4))
 
-        for i, value in enumerate(data):
-            if not (32 <= value and value <= 126):
-                data[i] = 63  # '?'
+    @staticmethod
+    def read_chunk_header(reader: BufferedIOBase) -> tuple[bytes, int]:
+        # The ID and the size of a sub-chunk are decoded by one call.
+        data = _BinaryReaderEx.read_exactly(reader, 8)
+        return _BinaryReaderEx._CHUNK_HEADER.unpack(data)  # type: ignore
 
-        return data.decode("ascii")
+    @staticmethod
+    def four_cc_to_str(four_cc: bytes) -> str:
+        return four_cc.translate(_BinaryReaderEx._PRINTABLE).decode("ascii")
 
     @staticmethod
     def read_fixed_length_string(reader: BufferedIOBase, length: int) -> str:
-        data = reader.read(length)
+        return _BinaryReaderEx.decode_fixed_length_string(
+            bytes(_BinaryReaderEx.read_exactly(reader, length))
+        )
 
-        actualLength = 0
-        for value in data:
-            if value == 0:
-                break
-            actualLength += 1
+    @staticmethod
+    def decode_fixed_length_string(data: bytes) -> str:
+        # The string ends at the first NUL, or fills the whole field.
+        return data.partition(b"\0")[0].decode("ascii")
 
-        return data[0:actualLength].decode("ascii")
+    @staticmethod
+    def discard_data(reader: BufferedIOBase, size: int) -> None:
+        reader.seek(size, io.SEEK_CUR)
 
     @staticmethod
     def read_int16_array_as_float_array(
         reader: BufferedIOBase, size: int
     ) -> Sequence[float]:
         count = int(size / 2)
-        data = array("h")
-        data.fromfile(reader, count)
 
-        return array("f", map(lambda x: x / 32768.0, data))
+        # The chunk is viewed as int16 in place, without an intermediate copy.
+        data: Sequence[int] = memoryview(
+            _BinaryReaderEx.read_exactly(reader, 2 * count)
+        ).cast("h")
+
+        # The sample data is stored in little-endian.
+        if sys.byteorder == "big":
+            swapped = array("h", data)
+            swapped.byteswap()
+            data = swapped
+
+        # Scaling by a power of two is exact, so this equals dividing by 32768.
+        return array("f", map((1.0 / 32768.0).__mul__, data))
 
 
 class _SoundFontMath:
+    _LOG_NON_AUDIBLE = math.log(1.0e-3)
+
     @staticmethod
     def half_pi() -> float:
         return math.pi / 2
@@ -108,23 +196,23 @@ class _SoundFontMath:
 
     @staticmethod
     def log_non_audible() -> float:
-        return math.log(1.0e-3)
+        return _SoundFontMath._LOG_NON_AUDIBLE
 
     @staticmethod
     def timecents_to_seconds(x: float) -> float:
-        return math.pow(2.0, (1.0 / 1200.0) * x)
+        return 2.0 ** ((1.0 / 1200.0) * x)
 
     @staticmethod
     def cents_to_hertz(x: float) -> float:
-        return 8.176 * math.pow(2.0, (1.0 / 1200.0) * x)
+        return 8.176 * 2.0 ** ((1.0 / 1200.0) * x)
 
     @staticmethod
     def cents_to_multiplying_factor(x: float) -> float:
-        return math.pow(2.0, (1.0 / 1200.0) * x)
+        return 2.0 ** ((1.0 / 1200.0) * x)
 
     @staticmethod
     def decibels_to_linear(x: float) -> float:
-        return math.pow(10.0, 0.05 * x)
+        return 10.0 ** (0.05 * x)
 
     @staticmethod
     def linear_to_decibels(x: float) -> float:
@@ -132,11 +220,11 @@ class _SoundFontMath:
 
     @staticmethod
     def key_number_to_multiplying_factor(cents: int, key: int) -> float:
-        return _SoundFontMath.timecents_to_seconds(cents * (60 - key))
+        return 2.0 ** ((1.0 / 1200.0) * (cents * (60 - key)))
 
     @staticmethod
     def exp_cutoff(x: float) -> float:
-        if x < _SoundFontMath.log_non_audible():
+        if x < _SoundFontMath._LOG_NON_AUDIBLE:
             return 0.0
         else:
             return math.exp(x)
@@ -169,6 +257,8 @@ class _ArrayMath:
 
 
 class SoundFontVersion:
+    __slots__ = ("_major", "_minor")
+
     _major: int
     _minor: int
 
@@ -176,6 +266,12 @@ class SoundFontVersion:
         self._major = major
         self._minor = minor
 
+    @staticmethod
+    def _read_from_chunk(reader: BufferedIOBase, size: int) -> "SoundFontVersion":
+        major = _BinaryReaderEx.read_uint16(reader)
+        minor = _BinaryReaderEx.read_uint16(reader)
+        return SoundFontVersion(major, minor)
+
     @property
     def major(self) -> int:
         return self._major
@@ -198,86 +294,50 @@ class SoundFontInfo:
     _comments: str = ""
     _tools: str = ""
 
+    # Maps each INFO sub-chunk ID to the field it sets and how to read it.
+    _FIELDS = {
+        b"ifil": ("_version", SoundFontVersion._read_from_chunk),  # type: ignore
+        b"isng": ("_target_sound_engine", _BinaryReaderEx.read_fixed_length_string),
+        b"INAM": ("_bank_name", _BinaryReaderEx.read_fixed_length_string),
+        b"irom": ("_rom_name", _BinaryReaderEx.read_fixed_length_string),
+        b"iver": ("_rom_version", SoundFontVersion._read_from_chunk),  # type: ignore
+        b"ICRD": ("_creation_date", _BinaryReaderEx.read_fixed_length_string),
+        b"IENG": ("_author", _BinaryReaderEx.read_fixed_length_string),
+        b"IPRD": ("_target_product", _BinaryReaderEx.read_fixed_length_string),
+        b"ICOP": ("_copyright", _BinaryReaderEx.read_fixed_length_string),
+        b"ICMT": ("_comments", _BinaryReaderEx.read_fixed_length_string),
+        b"ISFT": ("_tools", _BinaryReaderEx.read_fixed_length_string),
+    }
+
     def __init__(self, reader: BufferedIOBase) -> None:
         chunk_id = _BinaryReaderEx.read_four_cc(reader)
-        if chunk_id != "LIST":
+        if chunk_id != b"LIST":
             raise Exception("The LIST chunk was not found.")
 
         end = _BinaryReaderEx.read_uint32(reader)
         end += reader.tell()
 
         list_type = _BinaryReaderEx.read_four_cc(reader)
-        if list_type != "INFO":
+        if list_type != b"INFO":
             raise Exception(
                 "The type of the LIST chunk must be 'INFO', but was '"
-                + list_type
+                + _BinaryReaderEx.four_cc_to_str(list_type)
                 + "'."
             )
 
         while reader.tell() < end:
-            id = _BinaryReaderEx.read_four_cc(reader)
-            size = _BinaryReaderEx.read_uint32(reader)
-
-            match id:
-                case "ifil":
-                    self._version = SoundFontVersion(
-                        _BinaryReaderEx.read_uint16(reader),
-                        _BinaryReaderEx.read_uint16(reader),
-                    )
-
-                case "isng":
-                    self._target_sound_engine = (
-                        _BinaryReaderEx.read_fixed_length_string(reader, size)
-                    )
-
-                case "INAM":
-                    self._bank_name = _BinaryReaderEx.read_fixed_length_string(
-                        reader, size
-                    )
-
-                case "irom":
-                    self._rom_name = _BinaryReaderEx.read_fixed_length_string(
-                        reader, size
-                    )
-
-                case "iver":
-                    self._rom_version = SoundFontVersion(
-                        _BinaryReaderEx.read_uint16(reader),
-                        _BinaryReaderEx.read_uint16(reader),
-                    )
-
-                case "ICRD":
-                    self._creation_date = _BinaryReaderEx.read_fixed_length_string(
-                        reader, size
-                    )
-
-                case "IENG":
-                    self._author = _BinaryReaderEx.read_fixed_length_string(
-                        reader, size
-                    )
-
-                case "IPRD":
-                    self._target_product = _BinaryReaderEx.read_fixed_length_string(
-                        reader, size
-                    )
+            id, size = _BinaryReaderEx.read_chunk_header(reader)
 
-                case "ICOP":
-                    self._copyright = _BinaryReaderEx.read_fixed_length_string(
-                        reader, size
-                    )
-
-                case "ICMT":
-                    self._comments = _BinaryReaderEx.read_fixed_length_string(
-                        reader, size
-                    )
-
-                case "ISFT":
-                    self._tools = _BinaryReaderEx.read_fixed_length_string(reader, size)
+            field = SoundFontInfo._FIELDS.get(id)
+            if field is None:
+                raise Exception(
+                    "The INFO list contains an unknown ID '"
+                    + _BinaryReaderEx.four_cc_to_str(id)
+                    + "'."
+                )
 
-                case _:
-                    raise Exception(
-                        "The INFO list contains an unknown ID '" + id + "'."
-                    )
+            name, read = field
+            setattr(self, name, read(reader, size))
 
     @property
     def version(self) -> SoundFontVersion:
@@ -328,48 +388,50 @@ class _SoundFontSampleData:
     _bits_per_sample: int
     _samples: Sequence[float]
 
+    # Maps each sub-chunk ID to the function that reads it.
+    # The 24-bit extension (sm24) is not supported, so it is skipped.
+    _CHUNK_READERS = {
+        b"smpl": _BinaryReaderEx.read_int16_array_as_float_array,
+        b"sm24": _BinaryReaderEx.discard_data,
+    }
+
     def __init__(self, reader: BufferedIOBase) -> None:
         chunk_id = _BinaryReaderEx.read_four_cc(reader)
-        if chunk_id != "LIST":
+        if chunk_id != b"LIST":
             raise Exception("The LIST chunk was not found.")
 
         end = _BinaryReaderEx.read_uint32(reader)
         end += reader.tell()
 
         list_type = _BinaryReaderEx.read_four_cc(reader)
-        if list_type != "sdta":
+        if list_type != b"sdta":
             raise Exception(
                 "The type of the LIST chunk must be 'sdta', but was '"
-                + list_type
+                + _BinaryReaderEx.four_cc_to_str(list_type)
                 + "'."
             )
 
-        bits_per_sample: int = 0
-        samples: Optional[Sequence[float]] = None
+        # The contents of each sub-chunk, keyed by its ID.
+        chunks = dict[bytes, Any]()
 
         while reader.tell() < end:
-            id = _BinaryReaderEx.read_four_cc(reader)
-            size = _BinaryReaderEx.read_uint32(reader)
-
-            match id:
-                case "smpl":
-                    bits_per_sample = 16
-                    samples = _BinaryReaderEx.read_int16_array_as_float_array(
-                        reader, size
-                    )
+            id, size = _BinaryReaderEx.read_chunk_header(reader)
 
-                case "sm24":
-                    reader.seek(size, io.SEEK_CUR)
+            read = _SoundFontSampleData._CHUNK_READERS.get(id)
+            if read is None:
+                raise Exception(
+                    "The INFO list contains an unknown ID '"
+                    + _BinaryReaderEx.four_cc_to_str(id)
+                    + "'."
+                )
 
-                case _:
-                    raise Exception(
-                        "The INFO list contains an unknown ID '" + id + "'."
-                    )
+            chunks[id] = read(reader, size)
 
+        samples: Optional[Sequence[float]] = chunks.get(b"smpl")
         if samples is None:
             raise Exception("No valid sample data was found.")
 
-        self._bits_per_sample = bits_per_sample
+        self._bits_per_sample = 16
         self._samples = samples
 
     @property
@@ -381,7 +443,9 @@ class _SoundFontSampleData:
         return self._samples
 
 
-class _GeneratorType(IntEnum):
+class _GeneratorType:
+    # Plain ints rather than an IntEnum, since enum members are slow to index with.
+
     START_ADDRESS_OFFSET = 0
     END_ADDRESS_OFFSET = 1
     START_LOOP_ADDRESS_OFFSET = 2
@@ -445,37 +509,44 @@ class _GeneratorType(IntEnum):
     UNUSED_END = 60
 
 
-class _Generator:
-    _generator_type: _GeneratorType
-    _value: int
+class _GeneratorList:
+    __slots__ = ("_types", "_values")
 
-    def __init__(self, reader: BufferedIOBase) -> None:
-        self._generator_type = _GeneratorType(_BinaryReaderEx.read_uint16(reader))
-        self._value = _BinaryReaderEx.read_int16(reader)
+    _types: "array[int]"
+    _values: "array[int]"
+
+    def __init__(self, types: "array[int]", values: "array[int]") -> None:
+        self._types = types
+        self._values = values
 
     @staticmethod
-    def read_from_chunk(reader: BufferedIOBase, size: int) -> Sequence["_Generator"]:
+    def read_from_chunk(reader: BufferedIOBase, size: int) -> "_GeneratorList":
         if int(size % 4) != 0:
             raise Exception("The generator list is invalid.")
 
+        # The last one is the terminator.
         count = int(size / 4) - 1
-        generators = list[_Generator]()
+        data = array("H")
+        data.frombytes(_BinaryReaderEx.read_exactly(reader, size))
+        del data[2 * count :]
 
-        for _ in range(count):
-            generators.append(_Generator(reader))
+        # The generator list is stored in little-endian.
+        if sys.byteorder == "big":
+            data.byteswap()
 
-        # The last one is the terminator.
-        _Generator(reader)
+        # Each generator is a pair of an unsigned type and a signed value.
+        types = data[0::2]
+        values = array("h", data[1::2].tobytes())
 
-        return generators
+        return _GeneratorList(types, values)
 
     @property
-    def generator_type(self) -> _GeneratorType:
-        return self._generator_type
+    def types(self) -> "array[int]":
+        return self._types
 
     @property
-    def value(self) -> int:
-        return self._value
+    def values(self) -> "array[int]":
+        return self._values
 
 
 class _Modulator:
@@ -487,20 +558,23 @@ class _Modulator:
         reader.seek(size, io.SEEK_CUR)
 
 
-class _SampleType(IntEnum):
-    NONE = 0
-    MONO = 1
-    RIGHT = 2
-    LEFT = 4
-    LINKED = 8
-    ROM_MONO = 0x8001
-    ROM_RIGHT = 0x8002
-    ROM_LEFT = 0x8004
-    ROM_LINKED = 0x8008
-
-
 class SampleHeader:
-    _name: str
+    _STRUCT = struct.Struct("<20s5iBbHH")
+
+    __slots__ = (
+        "_name",
+        "_start",
+        "_end",
+        "_start_loop",
+        "_end_loop",
+        "_sample_rate",
+        "_original_pitch",
+        "_pitch_correction",
+        "_link",
+        "_sample_type",
+    )
+
+    _name: bytes
     _start: int
     _end: int
     _start_loop: int
@@ -509,39 +583,55 @@ class SampleHeader:
     _original_pitch: int
     _pitch_correction: int
     _link: int
-    _sample_type: _SampleType
+    _sample_type: int
 
-    def __init__(self, reader: BufferedIOBase) -> None:
-        self._name = _BinaryReaderEx.read_fixed_length_string(reader, 20)
-        self._start = _BinaryReaderEx.read_int32(reader)
-        self._end = _BinaryReaderEx.read_int32(reader)
-        self._start_loop = _BinaryReaderEx.read_int32(reader)
-        self._end_loop = _BinaryReaderEx.read_int32(reader)
-        self._sample_rate = _BinaryReaderEx.read_int32(reader)
-        self._original_pitch = _BinaryReaderEx.read_uint8(reader)
-        self._pitch_correction = _BinaryReaderEx.read_int8(reader)
-        self._link = _BinaryReaderEx.read_uint16(reader)
-        self._sample_type = _SampleType(_BinaryReaderEx.read_uint16(reader))
+    def __init__(
+        self,
+        name: bytes,
+        start: int,
+        end: int,
+        start_loop: int,
+        end_loop: int,
+        sample_rate: int,
+        original_pitch: int,
+        pitch_correction: int,
+        link: int,
+        sample_type: int,
+    ) -> None:
+        # The name is kept as raw bytes until it is requested.
+        self._name = name
+        self._start = start
+        self._end = end
+        self._start_loop = start_loop
+        self._end_loop = end_loop
+        self._sample_rate = sample_rate
+        self._original_pitch = original_pitch
+        self._pitch_correction = pitch_correction
+        self._link = link
+
+        # Kept as the raw value, since some files use vendor-specific types.
+        self._sample_type = sample_type
 
     @staticmethod
     def _read_from_chunk(reader: BufferedIOBase, size: int) -> Sequence["SampleHeader"]:
         if int(size % 46) != 0:
             raise Exception("The sample header list is invalid.")
 
-        count = int(size / 46) - 1
+        # The last one is the terminator, which an empty chunk does not have.
+        count = max(size // 46 - 1, 0)
         headers = list[SampleHeader]()
 
-        for _ in range(count):
-            headers.append(SampleHeader(reader))
-
-        # The last one is the terminator.
-        SampleHeader(reader)
+        records = SampleHeader._STRUCT.iter_unpack(
+            _BinaryReaderEx.read_exactly(reader, size)
+        )
+        for record in itertools.islice(records, count):
+            headers.append(SampleHeader(*record))
 
         return headers
 
     @property
     def name(self) -> str:
-        return self._name
+        return _BinaryReaderEx.decode_fixed_length_string(self._name)
 
     @property
     def start(self) -> int:
@@ -572,92 +662,86 @@ class SampleHeader:
         return self._pitch_correction
 
 
-class _ZoneInfo:
-    _generator_index: int
-    _modulator_index: int
-    _generator_count: int
-    _modulator_count: int
+class _Zone:
+    __slots__ = ("_generator_types", "_generator_values")
+
+    _generator_types: Sequence[int]
+    _generator_values: Sequence[int]
 
-    def __init__(self, reader: BufferedIOBase) -> None:
-        self._generator_index = _BinaryReaderEx.read_uint16(reader)
-        self._modulator_index = _BinaryReaderEx.read_uint16(reader)
+    def __init__(
+        self, generator_types: Sequence[int], generator_values: Sequence[int]
+    ) -> None:
+        self._generator_types = generator_types
+        self._generator_values = generator_values
 
     @staticmethod
-    def read_from_chunk(reader: BufferedIOBase, size: int) -> Sequence["_ZoneInfo"]:
+    def read_bag_from_chunk(reader: BufferedIOBase, size: int) -> Sequence[int]:
         if int(size % 4) != 0:
             raise Exception("The zone list is invalid.")
 
-        count = int(size / 4)
-        zones = list[_ZoneInfo]()
-
-        for i in range(count):
-            zones.append(_ZoneInfo(reader))
-
-        for i in range(count - 1):
-            zones[i]._generator_count = (
-                zones[i + 1]._generator_index - zones[i]._generator_index
-            )
-            zones[i]._modulator_count = (
-                zones[i + 1]._modulator_index - zones[i]._modulator_index
-            )
-
-        return zones
+        data = array("H")
+        data.frombytes(_BinaryReaderEx.read_exactly(reader, size))
 
-    @property
-    def generator_index(self) -> int:
-        return self._generator_index
+        # The zone list is stored in little-endian.
+        if sys.byteorder == "big":
+            data.byteswap()
 
-    @property
-    def modulator_index(self) -> int:
-        return self._modulator_index
-
-    @property
-    def generator_count(self) -> int:
-        return self._generator_count
-
-    @property
-    def modulator_count(self) -> int:
-        return self._modulator_count
-
-
-class _Zone:
-    _generators: Sequence[_Generator]
-
-    def __init__(self, generators: Sequence[_Generator]) -> None:
-        self._generators = generators
+        # Each zone is a pair of generator and modulator indices.
+        # Modulators are not supported, so only the generator indices are kept.
+        return data[0::2]
 
     @staticmethod
     def create(
-        infos: Sequence[_ZoneInfo], generators: Sequence[_Generator]
+        generator_indices: Sequence[int], generators: _GeneratorList
     ) -> Sequence["_Zone"]:
-        if len(infos) <= 1:
+        if len(generator_indices) <= 1:
             raise Exception("No valid zone was found.")
 
-        # The last one is the terminator.
-        count = len(infos) - 1
         zones = list[_Zone]()
 
-        for i in range(count):
-            info: _ZoneInfo = infos[i]
-
-            gs = list[_Generator]()
-            for j in range(info.generator_count):
-                gs.append(generators[info.generator_index + j])
+        # Each zone views its own range of the shared generator arrays.
+        types = memoryview(generators.types)
+        values = memoryview(generators.values)
 
-            zones.append(_Zone(gs))
+        # The generators of a zone end where those of the next zone start.
+        # The last one is the terminator, which only marks the end.
+        for start, end in itertools.pairwise(generator_indices):
+            zones.append(_Zone(types[start:end], values[start:end]))
 
         return zones
 
-    @staticmethod
-    def empty():
-        return _Zone(list[_Generator]())
+    @property
+    def generator_types(self) -> Sequence[int]:
+        return self._generator_types
 
     @property
-    def generators(self) -> Sequence[_Generator]:
-        return self._generators
+    def generator_values(self) -> Sequence[int]:
+        return self._generator_values
+
+
+def _set_zone_parameters(gs: MutableSequence[int], zone: _Zone) -> None:
+    count = len(gs)
+
+    for index, value in zip(zone.generator_types, zone.generator_values):
+        # Unknown generators should be ignored.
+        if index < count:
+            gs[index] = value
 
 
 class _PresetInfo:
+    _STRUCT = struct.Struct("<20s3H3i")
+
+    __slots__ = (
+        "_name",
+        "_patch_number",
+        "_bank_number",
+        "_zone_start_index",
+        "_zone_end_index",
+        "_library",
+        "_genre",
+        "_morphology",
+    )
+
     _name: str
     _patch_number: int
     _bank_number: int
@@ -667,28 +751,61 @@ class _PresetInfo:
     _genre: int
     _morphology: int
 
-    def __init__(self, reader: BufferedIOBase) -> None:
-        self._name = _BinaryReaderEx.read_fixed_length_string(reader, 20)
-        self._patch_number = _BinaryReaderEx.read_uint16(reader)
-        self._bank_number = _BinaryReaderEx.read_uint16(reader)
-        self._zone_start_index = _BinaryReaderEx.read_uint16(reader)
-        self._library = _BinaryReaderEx.read_int32(reader)
-        self._genre = _BinaryReaderEx.read_int32(reader)
-        self._morphology = _BinaryReaderEx.read_int32(reader)
+    def __init__(
+        self,
+        name: bytes,
+        patch_number: int,
+        bank_number: int,
+        zone_start_index: int,
+        library: int,
+        genre: int,
+        morphology: int,
+        zone_end_index: int,
+    ) -> None:
+        self._name = _BinaryReaderEx.decode_fixed_length_string(name)
+        self._patch_number = patch_number
+        self._bank_number = bank_number
+        self._zone_start_index = zone_start_index
+        self._zone_end_index = zone_end_index
+        self._library = library
+        self._genre = genre
+        self._morphology = morphology
 
     @staticmethod
     def read_from_chunk(reader: BufferedIOBase, size: int) -> Sequence["_PresetInfo"]:
         if int(size % 38) != 0:
             raise Exception("The preset list is invalid.")
 
-        count = int(size / 38)
         presets = list[_PresetInfo]()
 
-        for i in range(count):
-            presets.append(_PresetInfo(reader))
-
-        for i in range(count - 1):
-            presets[i]._zone_end_index = presets[i + 1].zone_start_index - 1
+        # The zones of a preset end where the next preset's zones start.
+        # The last one is the terminator, which is paired with itself.
+        records = list(
+            _PresetInfo._STRUCT.iter_unpack(_BinaryReaderEx.read_exactly(reader, size))
+        )
+        for current, following in itertools.pairwise(records + records[-1:]):
+            (
+                name,
+                patch_number,
+                bank_number,
+                zone_start_index,
+                library,
+                genre,
+                morphology,
+            ) = current
+            _, _, _, following_zone_start_index, *_ = following
+            presets.append(
+                _PresetInfo(
+                    name,
+                    patch_number,
+                    bank_number,
+                    zone_start_index,
+                    library,
+                    genre,
+                    morphology,
+                    zone_end_index=following_zone_start_index - 1,
+                )
+            )
 
         return presets
 
@@ -726,13 +843,18 @@ class _PresetInfo:
 
 
 class _InstrumentInfo:
+    _STRUCT = struct.Struct("<20sH")
+
+    __slots__ = ("_name", "_zone_start_index", "_zone_end_index")
+
     _name: str
     _zone_start_index: int
     _zone_end_index: int
 
-    def __init__(self, reader: BufferedIOBase) -> None:
-        self._name = _BinaryReaderEx.read_fixed_length_string(reader, 20)
-        self._zone_start_index = _BinaryReaderEx.read_uint16(reader)
+    def __init__(self, name: bytes, zone_start_index: int, zone_end_index: int) -> None:
+        self._name = _BinaryReaderEx.decode_fixed_length_string(name)
+        self._zone_start_index = zone_start_index
+        self._zone_end_index = zone_end_index
 
     @staticmethod
     def read_from_chunk(
@@ -741,14 +863,20 @@ class _InstrumentInfo:
         if int(size % 22) != 0:
             raise Exception("The instrument list is invalid.")
 
-        count = int(size / 22)
         instruments = list[_InstrumentInfo]()
 
-        for i in range(count):
-            instruments.append(_InstrumentInfo(reader))
-
-        for i in range(count - 1):
-            instruments[i]._zone_end_index = instruments[i + 1]._zone_start_index - 1
+        # The zones of an instrument end where the next instrument's zones start.
+        # The last one is the terminator, which is paired with itself.
+        records = list(
+            _InstrumentInfo._STRUCT.iter_unpack(
+                _BinaryReaderEx.read_exactly(reader, size)
+            )
+        )
+        for current, following in itertools.pairwise(records + records[-1:]):
+            name, zone_start_index = current
+            instruments.append(
+                _InstrumentInfo(name, zone_start_index, following[1] - 1)
+            )
 
         return instruments
 
@@ -765,9 +893,23 @@ class _InstrumentInfo:
         return self._zone_end_index
 
 
+_RegionT = TypeVar("_RegionT", "InstrumentRegion", "PresetRegion")
+
+
+def _group_regions_by_key(regions: Sequence[_RegionT]) -> Sequence[Sequence[_RegionT]]:
+    # The regions whose key range covers each key, in their original order.
+    regions_by_key = [list[_RegionT]() for _ in range(128)]
+    for region in regions:
+        end = min(region.key_range_end, 127)
+        for key in range(region.key_range_start, end + 1):
+            regions_by_key[key].append(region)
+    return regions_by_key
+
+
 class Instrument:
     _name: str
     _regions: Sequence["InstrumentRegion"]
+    _regions_by_key: Sequence[Sequence["InstrumentRegion"]]
 
     def __init__(
         self,
@@ -785,6 +927,8 @@ class Instrument:
 
         self._regions = InstrumentRegion._create(self, zone_span, samples)  # type: ignore
 
+        self._regions_by_key = _group_regions_by_key(self._regions)
+
     @staticmethod
     def _create(
         infos: Sequence[_InstrumentInfo],
@@ -819,42 +963,60 @@ class LoopMode(IntEnum):
 
 
 class InstrumentRegion:
+    __slots__ = (
+        "_sample",
+        "_gs",
+        "_sample_modes",
+        "_root_key",
+        "_sample_start",
+        "_sample_end",
+        "_sample_start_loop",
+        "_sample_end_loop",
+    )
+
     _sample: SampleHeader
     _gs: MutableSequence[int]
+    _sample_modes: LoopMode
+    _root_key: int
+    _sample_start: int
+    _sample_end: int
+    _sample_start_loop: int
+    _sample_end_loop: int
+
+    # The generator values of a zone that does not set them, copied per region.
+    # A list is used since it is faster to index than an array.
+    _DEFAULT_GS = [0] * 61
+    _DEFAULT_GS[_GeneratorType.INITIAL_FILTER_CUTOFF_FREQUENCY] = 13500
+    _DEFAULT_GS[_GeneratorType.DELAY_MODULATION_LFO] = -12000
+    _DEFAULT_GS[_GeneratorType.DELAY_VIBRATO_LFO] = -12000
+    _DEFAULT_GS[_GeneratorType.DELAY_MODULATION_ENVELOPE] = -12000
+    _DEFAULT_GS[_GeneratorType.ATTACK_MODULATION_ENVELOPE] = -12000
+    _DEFAULT_GS[_GeneratorType.HOLD_MODULATION_ENVELOPE] = -12000
+    _DEFAULT_GS[_GeneratorType.DECAY_MODULATION_ENVELOPE] = -12000
+    _DEFAULT_GS[_GeneratorType.RELEASE_MODULATION_ENVELOPE] = -12000
+    _DEFAULT_GS[_GeneratorType.DELAY_VOLUME_ENVELOPE] = -12000
+    _DEFAULT_GS[_GeneratorType.ATTACK_VOLUME_ENVELOPE] = -12000
+    _DEFAULT_GS[_GeneratorType.HOLD_VOLUME_ENVELOPE] = -12000
+    _DEFAULT_GS[_GeneratorType.DECAY_VOLUME_ENVELOPE] = -12000
+    _DEFAULT_GS[_GeneratorType.RELEASE_VOLUME_ENVELOPE] = -12000
+    _DEFAULT_GS[_GeneratorType.KEY_RANGE] = 0x7F00
+    _DEFAULT_GS[_GeneratorType.VELOCITY_RANGE] = 0x7F00
+    _DEFAULT_GS[_GeneratorType.KEY_NUMBER] = -1
+    _DEFAULT_GS[_GeneratorType.VELOCITY] = -1
+    _DEFAULT_GS[_GeneratorType.SCALE_TUNING] = 100
+    _DEFAULT_GS[_GeneratorType.OVERRIDING_ROOT_KEY] = -1
 
     def __init__(
         self,
         instrument: Instrument,
-        global_zone: _Zone,
+        global_gs: Sequence[int],
         local_zone: _Zone,
         samples: Sequence[SampleHeader],
     ) -> None:
-        self._gs = array("h", itertools.repeat(0, 61))
-        self._gs[_GeneratorType.INITIAL_FILTER_CUTOFF_FREQUENCY] = 13500
-        self._gs[_GeneratorType.DELAY_MODULATION_LFO] = -12000
-        self._gs[_GeneratorType.DELAY_VIBRATO_LFO] = -12000
-        self._gs[_GeneratorType.DELAY_MODULATION_ENVELOPE] = -12000
-        self._gs[_GeneratorType.ATTACK_MODULATION_ENVELOPE] = -12000
-        self._gs[_GeneratorType.HOLD_MODULATION_ENVELOPE] = -12000
-        self._gs[_GeneratorType.DECAY_MODULATION_ENVELOPE] = -12000
-        self._gs[_GeneratorType.RELEASE_MODULATION_ENVELOPE] = -12000
-        self._gs[_GeneratorType.DELAY_VOLUME_ENVELOPE] = -12000
-        self._gs[_GeneratorType.ATTACK_VOLUME_ENVELOPE] = -12000
-        self._gs[_GeneratorType.HOLD_VOLUME_ENVELOPE] = -12000
-        self._gs[_GeneratorType.DECAY_VOLUME_ENVELOPE] = -12000
-        self._gs[_GeneratorType.RELEASE_VOLUME_ENVELOPE] = -12000
-        self._gs[_GeneratorType.KEY_RANGE] = 0x7F00
-        self._gs[_GeneratorType.VELOCITY_RANGE] = 0x7F00
-        self._gs[_GeneratorType.KEY_NUMBER] = -1
-        self._gs[_GeneratorType.VELOCITY] = -1
-        self._gs[_GeneratorType.SCALE_TUNING] = 100
-        self._gs[_GeneratorType.OVERRIDING_ROOT_KEY] = -1
-
-        for generator in global_zone.generators:
-            self._set_parameter(generator)
-
-        for generator in local_zone.generators:
-            self._set_parameter(generator)
+        # The global zone has already been applied on top of the defaults.
+        self._gs = list(global_gs)
+
+        _set_zone_parameters(self._gs, local_zone)
 
         id = self._gs[_GeneratorType.SAMPLE_ID]
         if not (0 <= id and id < len(samples)):
@@ -867,24 +1029,43 @@ class InstrumentRegion:
             )
         self._sample = samples[id]
 
+        # These are read on every note-on and never change after loading.
+        # The unused value 2 and any undefined value are regarded as no loop,
+        # so that such a region does not prevent the whole file from loading.
+        sample_modes = self._gs[_GeneratorType.SAMPLE_MODES]
+        if sample_modes in (LoopMode.CONTINUOUS, LoopMode.LOOP_UNTIL_NOTE_OFF):
+            self._sample_modes = LoopMode(sample_modes)
+        else:
+            self._sample_modes = LoopMode.NO_LOOP
+        root_key = self._gs[_GeneratorType.OVERRIDING_ROOT_KEY]
+        self._root_key = root_key if root_key != -1 else self._sample._original_pitch  # type: ignore
+        self._sample_start = self._sample._start + self.start_address_offset  # type: ignore
+        self._sample_end = self._sample._end + self.end_address_offset  # type: ignore
+        self._sample_start_loop = (
+            self._sample._start_loop + self.start_loop_address_offset  # type: ignore
+        )
+        self._sample_end_loop = self._sample._end_loop + self.end_loop_address_offset  # type: ignore
+
     @staticmethod
     def _create(
         instrument: Instrument, zones: Sequence[_Zone], samples: Sequence[SampleHeader]
     ) -> Sequence["InstrumentRegion"]:
         # Is the first one the global zone?
         if (
-            len(zones[0].generators) == 0
-            or zones[0].generators[-1].generator_type != _GeneratorType.SAMPLE_ID
+            len(zones[0].generator_types) == 0
+            or zones[0].generator_types[-1] != _GeneratorType.SAMPLE_ID
         ):
             # The first one is the global zone.
-            global_zone = zones[0]
+            # It is regarded as the base setting of subsequent zones,
+            # so it is applied to the defaults only once.
+            global_gs = InstrumentRegion._DEFAULT_GS[:]
+            _set_zone_parameters(global_gs, zones[0])
 
-            # The global zone is regarded as the base setting of subsequent zones.
             count = len(zones) - 1
             regions = list[InstrumentRegion]()
             for i in range(count):
                 regions.append(
-                    InstrumentRegion(instrument, global_zone, zones[i + 1], samples)
+                    InstrumentRegion(instrument, global_gs, zones[i + 1], samples)
                 )
             return regions
 
@@ -894,24 +1075,20 @@ class InstrumentRegion:
             regions = list[InstrumentRegion]()
             for i in range(count):
                 regions.append(
-                    InstrumentRegion(instrument, _Zone.empty(), zones[i], samples)
+                    InstrumentRegion(
+                        instrument, InstrumentRegion._DEFAULT_GS, zones[i], samples
+                    )
                 )
             return regions
 
-    def _set_parameter(self, generator: _Generator) -> None:
-        index = int(generator.generator_type)
-
-        # Unknown generators should be ignored.
-        if 0 <= index and index < len(self._gs):
-            self._gs[index] = generator.value
-
     def contains(self, key: int, velocity: int) -> bool:
-        contains_key = self.key_range_start <= key and key <= self.key_range_end
-        contains_velocity = (
-            self.velocity_range_start <= velocity
-            and velocity <= self.velocity_range_end
-        )
-        return contains_key and contains_velocity
+        # Each range holds its start in the low byte and its end in the high byte.
+        key_range = self._gs[_GeneratorType.KEY_RANGE]
+        if not (key_range & 0xFF) <= key <= ((key_range >> 8) & 0xFF):
+            return False
+
+        velocity_range = self._gs[_GeneratorType.VELOCITY_RANGE]
+        return (velocity_range & 0xFF) <= velocity <= ((velocity_range >> 8) & 0xFF)
 
     @property
     def sample(self) -> SampleHeader:
@@ -919,19 +1096,19 @@ class InstrumentRegion:
 
     @property
     def sample_start(self) -> int:
-        return self._sample.start + self.start_address_offset
+        return self._sample_start
 
     @property
     def sample_end(self) -> int:
-        return self._sample.end + self.end_address_offset
+        return self._sample_end
 
     @property
     def sample_start_loop(self) -> int:
-        return self._sample.start_loop + self.start_loop_address_offset
+        return self._sample_start_loop
 
     @property
     def sample_end_loop(self) -> int:
-        return self._sample.end_loop + self.end_loop_address_offset
+        return self._sample_end_loop
 
     @property
     def start_address_offset(self) -> int:
@@ -1141,15 +1318,11 @@ class InstrumentRegion:
 
     @property
     def fine_tune(self) -> int:
-        return self._gs[_GeneratorType.FINE_TUNE] + self._sample.pitch_correction
+        return self._gs[_GeneratorType.FINE_TUNE] + self._sample._pitch_correction  # type: ignore
 
     @property
     def sample_modes(self) -> LoopMode:
-        return (
-            LoopMode(self._gs[_GeneratorType.SAMPLE_MODES])
-            if self._gs[_GeneratorType.SAMPLE_MODES] != 2
-            else LoopMode.NO_LOOP
-        )
+        return self._sample_modes
 
     @property
     def scale_tuning(self) -> int:
@@ -1161,11 +1334,7 @@ class InstrumentRegion:
 
     @property
     def root_key(self) -> int:
-        return (
-            self._gs[_GeneratorType.OVERRIDING_ROOT_KEY]
-            if self._gs[_GeneratorType.OVERRIDING_ROOT_KEY] != -1
-            else self._sample.original_pitch
-        )
+        return self._root_key
 
 
 class Preset:
@@ -1176,6 +1345,7 @@ class Preset:
     _genre: int
     _morphology: int
     _regions: Sequence["PresetRegion"]
+    _regions_by_key: Sequence[Sequence["PresetRegion"]]
 
     def __init__(
         self,
@@ -1198,6 +1368,8 @@ class Preset:
 
         self._regions = PresetRegion._create(self, zone_span, instruments)  # type: ignore
 
+        self._regions_by_key = _group_regions_by_key(self._regions)
+
     @staticmethod
     def _create(
         infos: Sequence[_PresetInfo],
@@ -1246,25 +1418,28 @@ class Preset:
 
 
 class PresetRegion:
+    __slots__ = ("_instrument", "_gs")
+
     _instrument: Instrument
     _gs: MutableSequence[int]
 
+    # The generator values of a zone that does not set them, copied per region.
+    # A list is used since it is faster to index than an array.
+    _DEFAULT_GS = [0] * 61
+    _DEFAULT_GS[_GeneratorType.KEY_RANGE] = 0x7F00
+    _DEFAULT_GS[_GeneratorType.VELOCITY_RANGE] = 0x7F00
+
     def __init__(
         self,
         preset: Preset,
-        global_zone: _Zone,
+        global_gs: Sequence[int],
         local_zone: _Zone,
         instruments: Sequence[Instrument],
     ) -> None:
-        self._gs = array("h", itertools.repeat(0, 61))
-        self._gs[_GeneratorType.KEY_RANGE] = 0x7F00
-        self._gs[_GeneratorType.VELOCITY_RANGE] = 0x7F00
+        # The global zone has already been applied on top of the defaults.
+        self._gs = list(global_gs)
 
-        for generator in global_zone.generators:
-            self._set_parameter(generator)
-
-        for generator in local_zone.generators:
-            self._set_parameter(generator)
+        _set_zone_parameters(self._gs, local_zone)
 
         id = self._gs[_GeneratorType.INSTRUMENT]
         if not (0 <= id and id < len(instruments)):
@@ -1283,18 +1458,20 @@ class PresetRegion:
     ) -> Sequence["PresetRegion"]:
         # Is the first one the global zone?
         if (
-            len(zones[0].generators) == 0
-            or zones[0].generators[-1].generator_type != _GeneratorType.INSTRUMENT
+            len(zones[0].generator_types) == 0
+            or zones[0].generator_types[-1] != _GeneratorType.INSTRUMENT
         ):
             # The first one is the global zone.
-            global_zone = zones[0]
+            # It is regarded as the base setting of subsequent zones,
+            # so it is applied to the defaults only once.
+            global_gs = PresetRegion._DEFAULT_GS[:]
+            _set_zone_parameters(global_gs, zones[0])
 
-            # The global zone is regarded as the base setting of subsequent zones.
             count = len(zones) - 1
             regions = list[PresetRegion]()
             for i in range(count):
                 regions.append(
-                    PresetRegion(preset, global_zone, zones[i + 1], instruments)
+                    PresetRegion(preset, global_gs, zones[i + 1], instruments)
                 )
             return regions
 
@@ -1304,24 +1481,20 @@ class PresetRegion:
             regions = list[PresetRegion]()
             for i in range(count):
                 regions.append(
-                    PresetRegion(preset, _Zone.empty(), zones[i], instruments)
+                    PresetRegion(
+                        preset, PresetRegion._DEFAULT_GS, zones[i], instruments
+                    )
                 )
             return regions
 
-    def _set_parameter(self, generator: _Generator) -> None:
-        index = int(generator.generator_type)
-
-        # Unknown generators should be ignored.
-        if 0 <= index and index < len(self._gs):
-            self._gs[index] = generator.value
-
     def contains(self, key: int, velocity: int) -> bool:
-        contains_key = self.key_range_start <= key and key <= self.key_range_end
-        contains_velocity = (
-            self.velocity_range_start <= velocity
-            and velocity <= self.velocity_range_end
-        )
-        return contains_key and contains_velocity
+        # Each range holds its start in the low byte and its end in the high byte.
+        key_range = self._gs[_GeneratorType.KEY_RANGE]
+        if not (key_range & 0xFF) <= key <= ((key_range >> 8) & 0xFF):
+            return False
+
+        velocity_range = self._gs[_GeneratorType.VELOCITY_RANGE]
+        return (velocity_range & 0xFF) <= velocity <= ((velocity_range >> 8) & 0xFF)
 
     @property
     def instrument(self) -> Instrument:
@@ -1519,66 +1692,58 @@ class _SoundFontParameters:
     _presets: Sequence[Preset]
     _instruments: Sequence[Instrument]
 
+    # Maps each sub-chunk ID to the function that reads it.
+    _CHUNK_READERS = {
+        b"phdr": _PresetInfo.read_from_chunk,
+        b"pbag": _Zone.read_bag_from_chunk,
+        b"pmod": _Modulator.discard_data,
+        b"pgen": _GeneratorList.read_from_chunk,
+        b"inst": _InstrumentInfo.read_from_chunk,
+        b"ibag": _Zone.read_bag_from_chunk,
+        b"imod": _Modulator.discard_data,
+        b"igen": _GeneratorList.read_from_chunk,
+        b"shdr": SampleHeader._read_from_chunk,  # type: ignore
+    }
+
     def __init__(self, reader: BufferedIOBase) -> None:
         chunk_id = _BinaryReaderEx.read_four_cc(reader)
-        if chunk_id != "LIST":
+        if chunk_id != b"LIST":
             raise Exception("The LIST chunk was not found.")
 
         end = _BinaryReaderEx.read_int32(reader)
         end += reader.tell()
 
         list_type = _BinaryReaderEx.read_four_cc(reader)
-        if list_type != "pdta":
+        if list_type != b"pdta":
             raise Exception(
                 "The type of the LIST chunk must be 'pdta', but was '"
-                + list_type
+                + _BinaryReaderEx.four_cc_to_str(list_type)
                 + "'."
             )
 
-        preset_infos: Optional[Sequence[_PresetInfo]] = None
-        preset_bag: Optional[Sequence[_ZoneInfo]] = None
-        preset_generators: Optional[Sequence[_Generator]] = None
-        instrument_infos: Optional[Sequence[_InstrumentInfo]] = None
-        instrument_bag: Optional[Sequence[_ZoneInfo]] = None
-        instrument_generators: Optional[Sequence[_Generator]] = None
-        sample_headers: Optional[Sequence[SampleHeader]] = None
+        # The contents of each sub-chunk, keyed by its ID.
+        chunks = dict[bytes, Any]()
 
         while reader.tell() < end:
-            id = _BinaryReaderEx.read_four_cc(reader)
-            size = _BinaryReaderEx.read_uint32(reader)
-
-            match id:
-                case "phdr":
-                    preset_infos = _PresetInfo.read_from_chunk(reader, size)
-
-                case "pbag":
-                    preset_bag = _ZoneInfo.read_from_chunk(reader, size)
-
-                case "pmod":
-                    _Modulator.discard_data(reader, size)
+            id, size = _BinaryReaderEx.read_chunk_header(reader)
 
-                case "pgen":
-                    preset_generators = _Generator.read_from_chunk(reader, size)
-
-                case "inst":
-                    instrument_infos = _InstrumentInfo.read_from_chunk(reader, size)
-
-                case "ibag":
-                    instrument_bag = _ZoneInfo.read_from_chunk(reader, size)
-
-                case "imod":
-                    _Modulator.discard_data(reader, size)
-
-                case "igen":
-                    instrument_generators = _Generator.read_from_chunk(reader, size)
+            read = _SoundFontParameters._CHUNK_READERS.get(id)
+            if read is None:
+                raise Exception(
+                    "The INFO list contains an unknown ID '"
+                    + _BinaryReaderEx.four_cc_to_str(id)
+                    + "'."
+                )
 
-                case "shdr":
-                    sample_headers = SampleHeader._read_from_chunk(reader, size)  # type: ignore
+            chunks[id] = read(reader, size)
 
-                case _:
-                    raise Exception(
-                        "The INFO list contains an unknown ID '" + id + "'."
-                    )
+        preset_infos: Optional[Sequence[_PresetInfo]] = chunks.get(b"phdr")
+        preset_bag: Optional[Sequence[int]] = chunks.get(b"pbag")
+        preset_generators: Optional[_GeneratorList] = chunks.get(b"pgen")
+        instrument_infos: Optional[Sequence[_InstrumentInfo]] = chunks.get(b"inst")
+        instrument_bag: Optional[Sequence[int]] = chunks.get(b"ibag")
+        instrument_generators: Optional[_GeneratorList] = chunks.get(b"igen")
+        sample_headers: Optional[Sequence[SampleHeader]] = chunks.get(b"shdr")
 
         if preset_infos is None:
             raise Exception("The PHDR sub-chunk was not found.")
@@ -1632,28 +1797,39 @@ class SoundFont:
     _presets: Sequence[Preset]
     _instruments: Sequence[Instrument]
 
-    def __init__(self, reader: BufferedIOBase) -> None:
-        chunk_id = _BinaryReaderEx.read_four_cc(reader)
-        if chunk_id != "RIFF":
+    def __init__(
+        self, reader: BufferedIOBase | bytes | bytearray | memoryview | mmap.mmap
+    ) -> None:
+        # The whole file is parsed from memory to avoid many small reads.
+        if isinstance(reader, (bytes, bytearray, memoryview, mmap.mmap)):
+            data = reader
+        else:
+            data = reader.read()
+
+        # _MemoryReader provides the part of BufferedIOBase that the parsers use.
+        memory_reader = cast(BufferedIOBase, _MemoryReader(data))
+
+        chunk_id = _BinaryReaderEx.read_four_cc(memory_reader)
+        if chunk_id != b"RIFF":
             raise Exception("The RIFF chunk was not found.")
 
-        _BinaryReaderEx.read_uint32(reader)
+        _BinaryReaderEx.read_uint32(memory_reader)
 
-        form_type = _BinaryReaderEx.read_four_cc(reader)
-        if form_type != "sfbk":
+        form_type = _BinaryReaderEx.read_four_cc(memory_reader)
+        if form_type != b"sfbk":
             raise Exception(
                 "The type of the RIFF chunk must be 'sfbk', but was '"
-                + form_type
+                + _BinaryReaderEx.four_cc_to_str(form_type)
                 + "'."
             )
 
-        self._info = SoundFontInfo(reader)
+        self._info = SoundFontInfo(memory_reader)
 
-        sample_data = _SoundFontSampleData(reader)
+        sample_data = _SoundFontSampleData(memory_reader)
         self._bits_per_sample = sample_data.bits_per_sample
         self._wave_data = sample_data.samples
 
-        parameters = _SoundFontParameters(reader)
+        parameters = _SoundFontParameters(memory_reader)
         self._sample_headers = parameters.sample_headers
         self._presets = parameters.presets
         self._instruments = parameters.instruments
@@ -1661,7 +1837,15 @@ class SoundFont:
     @classmethod
     def from_file(cls, file_path: str) -> "SoundFont":
         with open(file_path, "rb") as f:
-            return cls(f)
+            try:
+                # The file is mapped rather than read, so it is never copied as a whole.
+                # The mapping is released once nothing refers to it after parsing.
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Empty files and some special files cannot be mapped.
+                return cls(f)
+
+        return cls(data)
 
     @property
     def info(self) -> SoundFontInfo:
@@ -1685,15 +1869,22 @@ class SoundFont:
 
 
 class _RegionPair:
+    # The generators of a region pair never change once loaded,
+    # so each value is computed on first use and then read as a plain attribute.
+
     _preset: PresetRegion
     _instrument: InstrumentRegion
+    _gs: Sequence[int]
 
     def __init__(self, preset: PresetRegion, instrument: InstrumentRegion) -> None:
         self._preset = preset
         self._instrument = instrument
 
-    def get_value(self, generator_type: _GeneratorType) -> int:
-        return self._preset._gs[generator_type] + self._instrument._gs[generator_type]  # type: ignore
+        # The generator values are summed in one pass rather than on each lookup.
+        self._gs = list(map(operator.add, preset._gs, instrument._gs))  # type: ignore
+
+    def get_value(self, generator_type: int) -> int:
+        return self._gs[generator_type]
 
     @property
     def preset(self) -> PresetRegion:
@@ -1703,224 +1894,224 @@ class _RegionPair:
     def instrument(self) -> InstrumentRegion:
         return self._instrument
 
-    @property
+    @functools.cached_property
     def sample_start(self) -> int:
-        return self._instrument.sample_start
+        return self._instrument._sample_start  # type: ignore
 
-    @property
+    @functools.cached_property
     def sample_end(self) -> int:
-        return self._instrument.sample_end
+        return self._instrument._sample_end  # type: ignore
 
-    @property
+    @functools.cached_property
     def sample_start_loop(self) -> int:
-        return self._instrument.sample_start_loop
+        return self._instrument._sample_start_loop  # type: ignore
 
-    @property
+    @functools.cached_property
     def sample_end_loop(self) -> int:
-        return self._instrument.sample_end_loop
+        return self._instrument._sample_end_loop  # type: ignore
 
-    @property
+    @functools.cached_property
     def start_address_offset(self) -> int:
         return self._instrument.start_address_offset
 
-    @property
+    @functools.cached_property
     def end_address_offset(self) -> int:
         return self._instrument.end_address_offset
 
-    @property
+    @functools.cached_property
     def start_loop_address_offset(self) -> int:
         return self._instrument.start_loop_address_offset
 
-    @property
+    @functools.cached_property
     def end_loop_address_offset(self) -> int:
         return self._instrument.end_loop_address_offset
 
-    @property
+    @functools.cached_property
     def modulation_lfo_to_pitch(self) -> int:
         return self.get_value(_GeneratorType.MODULATION_LFO_TO_PITCH)
 
-    @property
+    @functools.cached_property
     def vibrato_lfo_to_pitch(self) -> int:
         return self.get_value(_GeneratorType.VIBRATO_LFO_TO_PITCH)
 
-    @property
+    @functools.cached_property
     def modulation_envelope_to_pitch(self) -> int:
         return self.get_value(_GeneratorType.MODULATION_ENVELOPE_TO_PITCH)
 
-    @property
+    @functools.cached_property
     def initial_filter_cutoff_frequency(self) -> float:
         return _SoundFontMath.cents_to_hertz(
             self.get_value(_GeneratorType.INITIAL_FILTER_CUTOFF_FREQUENCY)
         )
 
-    @property
+    @functools.cached_property
     def initial_filter_q(self) -> float:
         return 0.1 * self.get_value(_GeneratorType.INITIAL_FILTER_Q)
 
-    @property
+    @functools.cached_property
     def modulation_lfo_to_filter_cutoff_frequency(self) -> int:
         return self.get_value(_GeneratorType.MODULATION_LFO_TO_FILTER_CUTOFF_FREQUENCY)
 
-    @property
+    @functools.cached_property
     def modulation_envelope_to_filter_cutoff_frequency(self) -> int:
         return self.get_value(
             _GeneratorType.MODULATION_ENVELOPE_TO_FILTER_CUTOFF_FREQUENCY
         )
 
-    @property
+    @functools.cached_property
     def modulation_lfo_to_volume(self) -> float:
         return 0.1 * self.get_value(_GeneratorType.MODULATION_LFO_TO_VOLUME)
 
-    @property
+    @functools.cached_property
     def chorus_effects_send(self) -> float:
         return 0.1 * self.get_value(_GeneratorType.CHORUS_EFFECTS_SEND)
 
-    @property
+    @functools.cached_property
     def reverb_effects_send(self) -> float:
         return 0.1 * self.get_value(_GeneratorType.REVERB_EFFECTS_SEND)
 
-    @property
+    @functools.cached_property
     def pan(self) -> float:
         return 0.1 * self.get_value(_GeneratorType.PAN)
 
-    @property
+    @functools.cached_property
     def delay_modulation_lfo(self) -> float:
         return _SoundFontMath.timecents_to_seconds(
             self.get_value(_GeneratorType.DELAY_MODULATION_LFO)
         )
 
-    @property
+    @functools.cached_property
     def frequency_modulation_lfo(self) -> float:
         return _SoundFontMath.cents_to_hertz(
             self.get_value(_GeneratorType.FREQUENCY_MODULATION_LFO)
         )
 
-    @property
+    @functools.cached_property
     def delay_vibrato_lfo(self) -> float:
         return _SoundFontMath.timecents_to_seconds(
             self.get_value(_GeneratorType.DELAY_VIBRATO_LFO)
         )
 
-    @property
+    @functools.cached_property
     def frequency_vibrato_lfo(self) -> float:
         return _SoundFontMath.cents_to_hertz(
             self.get_value(_GeneratorType.FREQUENCY_VIBRATO_LFO)
         )
 
-    @property
+    @functools.cached_property
     def delay_modulation_envelope(self) -> float:
         return _SoundFontMath.timecents_to_seconds(
             self.get_value(_GeneratorType.DELAY_MODULATION_ENVELOPE)
         )
 
-    @property
+    @functools.cached_property
     def attack_modulation_envelope(self) -> float:
         return _SoundFontMath.timecents_to_seconds(
             self.get_value(_GeneratorType.ATTACK_MODULATION_ENVELOPE)
         )
 
-    @property
+    @functools.cached_property
     def hold_modulation_envelope(self) -> float:
         return _SoundFontMath.timecents_to_seconds(
             self.get_value(_GeneratorType.HOLD_MODULATION_ENVELOPE)
         )
 
-    @property
+    @functools.cached_property
     def decay_modulation_envelope(self) -> float:
         return _SoundFontMath.timecents_to_seconds(
             self.get_value(_GeneratorType.DECAY_MODULATION_ENVELOPE)
         )
 
-    @property
+    @functools.cached_property
     def sustain_modulation_envelope(self) -> float:
         return 0.1 * self.get_value(_GeneratorType.SUSTAIN_MODULATION_ENVELOPE)
 
-    @property
+    @functools.cached_property
     def release_modulation_envelope(self) -> float:
         return _SoundFontMath.timecents_to_seconds(
             self.get_value(_GeneratorType.RELEASE_MODULATION_ENVELOPE)
         )
 
-    @property
+    @functools.cached_property
     def key_number_to_modulation_envelope_hold(self) -> int:
         return self.get_value(_GeneratorType.KEY_NUMBER_TO_MODULATION_ENVELOPE_HOLD)
 
-    @property
+    @functools.cached_property
     def key_number_to_modulation_envelope_decay(self) -> int:
         return self.get_value(_GeneratorType.KEY_NUMBER_TO_MODULATION_ENVELOPE_DECAY)
 
-    @property
+    @functools.cached_property
     def delay_volume_envelope(self) -> float:
         return _SoundFontMath.timecents_to_seconds(
             self.get_value(_GeneratorType.DELAY_VOLUME_ENVELOPE)
         )
 
-    @property
+    @functools.cached_property
     def attack_volume_envelope(self) -> float:
         return _SoundFontMath.timecents_to_seconds(
             self.get_value(_GeneratorType.ATTACK_VOLUME_ENVELOPE)
         )
 
-    @property
+    @functools.cached_property
     def hold_volume_envelope(self) -> float:
         return _SoundFontMath.timecents_to_seconds(
             self.get_value(_GeneratorType.HOLD_VOLUME_ENVELOPE)
         )
 
-    @property
+    @functools.cached_property
     def decay_volume_envelope(self) -> float:
         return _SoundFontMath.timecents_to_seconds(
             self.get_value(_GeneratorType.DECAY_VOLUME_ENVELOPE)
         )
 
-    @property
+    @functools.cached_property
     def sustain_volume_envelope(self) -> float:
         return 0.1 * self.get_value(_GeneratorType.SUSTAIN_VOLUME_ENVELOPE)
 
-    @property
+    @functools.cached_property
     def release_volume_envelope(self) -> float:
         return _SoundFontMath.timecents_to_seconds(
             self.get_value(_GeneratorType.RELEASE_VOLUME_ENVELOPE)
         )
 
-    @property
+    @functools.cached_property
     def key_number_to_volume_envelope_hold(self) -> int:
         return self.get_value(_GeneratorType.KEY_NUMBER_TO_VOLUME_ENVELOPE_HOLD)
 
-    @property
+    @functools.cached_property
     def key_number_to_volume_envelope_decay(self) -> int:
         return self.get_value(_GeneratorType.KEY_NUMBER_TO_VOLUME_ENVELOPE_DECAY)
 
-    @property
+    @functools.cached_property
     def initial_attenuation(self) -> float:
         return 0.1 * self.get_value(_GeneratorType.INITIAL_ATTENUATION)
 
-    @property
+    @functools.cached_property
     def coarse_tune(self) -> int:
         return self.get_value(_GeneratorType.COARSE_TUNE)
 
-    @property
+    @functools.cached_property
     def fine_tune(self) -> int:
         return (
             self.get_value(_GeneratorType.FINE_TUNE)
-            + self._instrument.sample.pitch_correction
+            + self._instrument._sample._pitch_correction  # type: ignore
         )
 
-    @property
+    @functools.cached_property
     def sample_modes(self) -> LoopMode:
-        return self._instrument.sample_modes
+        return self._instrument._sample_modes  # type: ignore
 
-    @property
+    @functools.cached_property
     def scale_tuning(self) -> int:
         return self.get_value(_GeneratorType.SCALE_TUNING)
 
-    @property
+    @functools.cached_property
     def exclusive_class(self) -> int:
         return self._instrument.exclusive_class
 
-    @property
+    @functools.cached_property
     def root_key(self) -> int:
-        return self._instrument.root_key
+        return self._instrument._root_key  # type: ignore
 
 
 class _Oscillator:
@@ -1943,6 +2134,9 @@ class _Oscillator:
 
     _position: float
 
+    _pitch: float
+    _pitch_ratio: float
+
     def __init__(self, synthesizer: "Synthesizer") -> None:
         self._synthesizer = synthesizer
 
@@ -1980,14 +2174,26 @@ class _Oscillator:
 
         self._position = start
 
+        # NaN never compares equal, so the first block always computes the ratio.
+        self._pitch = math.nan
+        self._pitch_ratio = 0.0
+
     def release(self) -> None:
         if self._loop_mode == LoopMode.LOOP_UNTIL_NOTE_OFF:
             self._looping = False
 
     def process(self, block: MutableSequence[float], pitch: float) -> bool:
-        pitch_change = self._pitch_change_scale * (pitch - self._root_key) + self._tune
-        pitch_ratio = self._sample_rate_ratio * math.pow(2.0, pitch_change / 12.0)
-        return self.fill_block(block, pitch_ratio)
+        # Without modulation the pitch stays the same, so the last ratio is reused.
+        if pitch != self._pitch:
+            pitch_change = (
+                self._pitch_change_scale * (pitch - self._root_key) + self._tune
+            )
+            self._pitch_ratio = self._sample_rate_ratio * math.pow(
+                2.0, pitch_change / 12.0
+            )
+            self._pitch = pitch
+
+        return self.fill_block(block, self._pitch_ratio)
 
     def fill_block(self, block: MutableSequence[float], pitch_ratio: float) -> bool:
         if self._looping:
@@ -1998,10 +2204,16 @@ class _Oscillator:
     def fill_block_no_loop(
         self, block: MutableSequence[float], pitch_ratio: float
     ) -> bool:
+        # The state is kept in locals during the loop and stored back afterwards.
+        data = self._data
+        end = self._end
+        position = self._position
+
         for t in range(len(block)):
-            index = int(self._position)
+            index = int(position)
 
-            if index >= self._end:
+            if index >= end:
+                self._position = position
                 if t > 0:
                     for u in range(t, len(block)):
                         block[u] = 0
@@ -2009,39 +2221,46 @@ class _Oscillator:
                 else:
                     return False
 
-            x1 = self._data[index]
-            x2 = self._data[index + 1]
-            a = self._position - index
+            x1 = data[index]
+            x2 = data[index + 1]
+            a = position - index
             block[t] = x1 + a * (x2 - x1)
 
-            self._position += pitch_ratio
+            position += pitch_ratio
 
+        self._position = position
         return True
 
     def fill_block_continuous(
         self, block: MutableSequence[float], pitch_ratio: float
     ) -> bool:
-        end_loop_position = float(self._end_loop)
+        end_loop = self._end_loop
+        end_loop_position = float(end_loop)
 
-        loop_length = self._end_loop - self._start_loop
+        loop_length = end_loop - self._start_loop
+
+        # The state is kept in locals during the loop and stored back afterwards.
+        data = self._data
+        position = self._position
 
         for t in range(len(block)):
-            if self._position >= end_loop_position:
-                self._position -= loop_length
+            if position >= end_loop_position:
+                position -= loop_length
 
-            index1 = int(self._position)
+            index1 = int(position)
             index2 = index1 + 1
 
-            if index2 >= self._end_loop:
+            if index2 >= end_loop:
                 index2 -= loop_length
 
-            x1 = self._data[index1]
-            x2 = self._data[index2]
-            a = self._position - index1
+            x1 = data[index1]
+            x2 = data[index2]
+            a = position - index1
             block[t] = x1 + a * (x2 - x1)
 
-            self._position += pitch_ratio
+            position += pitch_ratio
 
+        self._position = position
         return True
 
 
@@ -2367,7 +2586,7 @@ class _RegionEx:
     def start_oscillator(
         oscillator: _Oscillator, data: Sequence[float], region: _RegionPair
     ) -> None:
-        sample_rate = region.instrument.sample.sample_rate
+        sample_rate = region._instrument._sample._sample_rate  # type: ignore
         loop_mode = region.sample_modes
         start = region.sample_start
         end = region.sample_end
@@ -2644,7 +2863,7 @@ class _Channel:
         self._rpn = (self._rpn & 0x7F) | (value << 7)
 
     def set_rpn_fine(self, value: int) -> None:
-        self._vrpn = (self._rpn & 0xFF80) | value
+        self._rpn = (self._rpn & 0xFF80) | value
 
     def data_entry_coarse(self, value: int) -> None:
         match self._rpn:
@@ -2736,11 +2955,11 @@ class _VoiceState(IntEnum):
 class _Voice:
     _synthesizer: "Synthesizer"
 
-    _volEnv: _VolumeEnvelope
-    _modEnv: _ModulationEnvelope
+    _vol_env: _VolumeEnvelope
+    _mod_env: _ModulationEnvelope
 
-    _vibLfo: _Lfo
-    _modLfo: _Lfo
+    _vib_lfo: _Lfo
+    _mod_lfo: _Lfo
 
     _oscillator: _Oscillator
     _filter: _BiQuadFilter
@@ -2950,11 +3169,14 @@ class _Voice:
             self._current_mix_gain_left = mix_gain * math.cos(angle)
             self._current_mix_gain_right = mix_gain * math.sin(angle)
 
-        self._current_reverb_send = _SoundFontMath.clamp(
-            channel_info.reverb_send + self._instrument_reverb, 0, 1
+        # Clamped to [0, 1] inline, as this runs for every voice in every block.
+        reverb_send = channel_info.reverb_send + self._instrument_reverb
+        chorus_send = channel_info.chorus_send + self._instrument_chorus
+        self._current_reverb_send = (
+            0 if reverb_send < 0 else 1 if reverb_send > 1 else reverb_send
         )
-        self._current_chorus_send = _SoundFontMath.clamp(
-            channel_info.chorus_send + self._instrument_chorus, 0, 1
+        self._current_chorus_send = (
+            0 if chorus_send < 0 else 1 if chorus_send > 1 else chorus_send
         )
 
         if self._voice_length == 0:
@@ -3214,6 +3436,8 @@ class Synthesizer:
     _preset_lookup: dict[int, Preset]
     _default_preset: Preset
 
+    _region_pairs: dict[tuple[PresetRegion, InstrumentRegion], _RegionPair]
+
     _channels: list[_Channel]
 
     _voices: _VoiceCollection
@@ -3253,6 +3477,9 @@ class Synthesizer:
                 self._default_preset = preset
                 min_preset_id = preset_id
 
+        # Region pairs are reused, so their derived values are computed only once.
+        self._region_pairs = dict[tuple[PresetRegion, InstrumentRegion], _RegionPair]()
+
         self._channels = list[_Channel]()
         for i in range(Synthesizer._CHANNEL_COUNT):
             self._channels.append(_Channel(self, i == Synthesizer._PERCUSSION_CHANNEL))
@@ -3375,10 +3602,8 @@ class Synthesizer:
 
         preset_id = (channel_info.bank_number << 16) | channel_info.patch_number
 
-        preset = self._sound_font.presets[0]
-        if preset_id in self._preset_lookup:
-            preset = self._preset_lookup[preset_id]
-        else:
+        preset = self._preset_lookup.get(preset_id)
+        if preset is None:
             # Try fallback to the GM sound set.
             # Normally, the given patch number + the bank number 0 will work.
             # For drums (bank number >= 128), it seems to be better to select the standard set (128:0).
@@ -3387,17 +3612,31 @@ class Synthesizer:
                 if channel_info.bank_number < 128
                 else (128 << 16)
             )
-            if gm_preset_id in self._preset_lookup:
-                preset = self._preset_lookup[gm_preset_id]
-            else:
-                # No corresponding preset was found. Use the default one...
-                preset = self._default_preset
+            # If no corresponding preset was found, use the default one...
+            preset = self._preset_lookup.get(gm_preset_id, self._default_preset)
+
+        # Only the regions indexed under the key need to be checked.
+        by_key = 0 <= key and key < 128
 
-        for preset_region in preset.regions:
+        if by_key:
+            preset_regions = preset._regions_by_key[key]  # type: ignore
+        else:
+            preset_regions = preset.regions
+
+        for preset_region in preset_regions:
             if preset_region.contains(key, velocity):
-                for instrument_region in preset_region.instrument.regions:
+                instrument = preset_region.instrument
+                if by_key:
+                    instrument_regions = instrument._regions_by_key[key]  # type: ignore
+                else:
+                    instrument_regions = instrument.regions
+                for instrument_region in instrument_regions:
                     if instrument_region.contains(key, velocity):
-                        region_pair = _RegionPair(preset_region, instrument_region)
+                        pair = (preset_region, instrument_region)
+                        region_pair = self._region_pairs.get(pair)
+                        if region_pair is None:
+                            region_pair = _RegionPair(preset_region, instrument_region)
+                            self._region_pairs[pair] = region_pair
                         voice = self._voices.request_new(instrument_region, channel)
                         voice.start(region_pair, channel, key, velocity)
 
@@ -3458,6 +3697,20 @@ class Synthesizer:
 
         wrote = 0
 
+        # Bound to locals, as they are accessed for every sample.
+        block_left = self._block_left
+        block_right = self._block_right
+
+        # Buffers from create_buffer and plain lists can take whole slices of the block.
+        # Slice assignment would resize them instead of failing when the range does not
+        # fit, so other cases are left to the per-sample copy, which raises IndexError.
+        sliceable = (
+            0 <= offset
+            and offset + count <= len(left)
+            and Synthesizer._is_sliceable(left)
+            and Synthesizer._is_sliceable(right)
+        )
+
         while wrote < count:
             if self._block_read == self._block_size:
                 self._render_block()
@@ -3467,19 +3720,34 @@ class Synthesizer:
             dst_rem = count - wrote
             rem = min(src_rem, dst_rem)
 
-            for t in range(rem):
-                left[offset + wrote + t] = self._block_left[self._block_read + t]
-                right[offset + wrote + t] = self._block_right[self._block_read + t]
+            src = self._block_read
+            dst = offset + wrote
+            if sliceable:
+                left[dst : dst + rem] = block_left[src : src + rem]
+                right[dst : dst + rem] = block_right[src : src + rem]
+            else:
+                for t in range(rem):
+                    left[dst + t] = block_left[src + t]
+                    right[dst + t] = block_right[src + t]
 
             self._block_read += rem
             wrote += rem
 
+    @staticmethod
+    def _is_sliceable(buffer: MutableSequence[float]) -> bool:
+        if isinstance(buffer, array):
+            return buffer.typecode == "d"
+        else:
+            return isinstance(buffer, list)
+
     def _render_block(self) -> None:
         self._voices.process()
 
+        block_left = self._block_left
+        block_right = self._block_right
         for t in range(self._block_size):
-            self._block_left[t] = 0
-            self._block_right[t] = 0
+            block_left[t] = 0
+            block_right[t] = 0
 
         for i in range(self._voices.active_voice_count):
             voice = self._voices._voices[i]  # type: ignore
@@ -3634,9 +3902,11 @@ class MidiFile:
 
     def __init__(self, reader: BufferedIOBase) -> None:
         chunk_type = _BinaryReaderEx.read_four_cc(reader)
-        if chunk_type != "MThd":
+        if chunk_type != b"MThd":
             raise Exception(
-                "The chunk type must be 'MThd', but was '" + chunk_type + "'."
+                "The chunk type must be 'MThd', but was '"
+                + _BinaryReaderEx.four_cc_to_str(chunk_type)
+                + "'."
             )
 
         size = _BinaryReaderEx.read_int32_big_endian(reader)
@@ -3673,9 +3943,11 @@ class MidiFile:
     @staticmethod
     def _read_track(reader: BufferedIOBase) -> tuple[list[_MidiMessage], list[int]]:
         chunk_type = _BinaryReaderEx.read_four_cc(reader)
-        if chunk_type != "MTrk":
+        if chunk_type != b"MTrk":
             raise Exception(
-                "The chunk type must be 'MTrk', but was '" + chunk_type + "'."
+                "The chunk type must be 'MTrk', but was '"
+                + _BinaryReaderEx.four_cc_to_str(chunk_type)
+                + "'."
             )
 
         end = _BinaryReaderEx.read_int32_big_endian(reader)
@@ -3687,9 +3959,13 @@ class MidiFile:
         tick = 0
         last_status = 0
 
+        # Bound to locals, as they are called for every event.
+        read_uint8 = _BinaryReaderEx.read_uint8
+        read_int_variable_length = _BinaryReaderEx.read_int_variable_length
+
         while True:
-            delta = _BinaryReaderEx.read_int_variable_length(reader)
-            first = _BinaryReaderEx.read_uint8(reader)
+            delta = read_int_variable_length(reader)
+            first = read_uint8(reader)
 
             tick += delta
 
@@ -3699,7 +3975,7 @@ class MidiFile:
                     messages.append(_MidiMessage.common1(last_status, first))
                     ticks.append(tick)
                 else:
-                    data2 = _BinaryReaderEx.read_uint8(reader)
+                    data2 = read_uint8(reader)
                     messages.append(_MidiMessage.common2(last_status, first, data2))
                     ticks.append(tick)
 
@@ -3713,9 +3989,9 @@ class MidiFile:
                     MidiFile.discard_data(reader)
 
                 case 0xFF:  # Meta Event
-                    match _BinaryReaderEx.read_uint8(reader):
+                    match read_uint8(reader):
                         case 0x2F:  # End of Track
-                            _BinaryReaderEx.read_uint8(reader)
+                            read_uint8(reader)
                             messages.append(_MidiMessage.end_of_track())
                             ticks.append(tick)
 
@@ -3736,12 +4012,12 @@ class MidiFile:
                 case _:
                     command = first & 0xF0
                     if command == 0xC0 or command == 0xD0:
-                        data1 = _BinaryReaderEx.read_uint8(reader)
+                        data1 = read_uint8(reader)
                         messages.append(_MidiMessage.common1(first, data1))
                         ticks.append(tick)
                     else:
-                        data1 = _BinaryReaderEx.read_uint8(reader)
-                        data2 = _BinaryReaderEx.read_uint8(reader)
+                        data1 = read_uint8(reader)
+                        data2 = read_uint8(reader)
                         messages.append(_MidiMessage.common2(first, data1, data2))
                         ticks.append(tick)
 
@@ -3756,7 +4032,7 @@ class MidiFile:
         merged_messages = list[_MidiMessage]()
         merged_times = list[float]()
 
-        indices = list[int](itertools.repeat(0, len(message_lists)))
+        indices = [0] * len(message_lists)
 
         current_tick: int = 0
         current_time: float = 0.0
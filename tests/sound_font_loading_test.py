@@ -0,0 +1,75 @@
+# type: ignore
+
+import io
+import os
+import tempfile
+import unittest
+
+import meltysynth as ms
+
+
+
+class TestSoundFontLoading(unittest.TestCase):
+
+    def assert_same_sound_font(self, expected, actual) -> None:
+
+        self.assertEqual(len(actual.presets), len(expected.presets))
+        for expected_preset, actual_preset in zip(expected.presets, actual.presets):
+            self.assertEqual(actual_preset.name, expected_preset.name)
+            self.assertEqual(actual_preset.patch_number, expected_preset.patch_number)
+            self.assertEqual(actual_preset.bank_number, expected_preset.bank_number)
+            self.assertEqual(len(actual_preset.regions), len(expected_preset.regions))
+
+        self.assertEqual(list(actual.wave_data), list(expected.wave_data))
+
+    def test_from_file(self) -> None:
+
+        file = io.open("TimGM6mb.sf2", "rb")
+        expected = ms.SoundFont(file)
+        file.close()
+
+        actual = ms.SoundFont.from_file("TimGM6mb.sf2")
+
+        self.assert_same_sound_font(expected, actual)
+
+    def test_in_memory(self) -> None:
+
+        file = io.open("TimGM6mb.sf2", "rb")
+        expected = ms.SoundFont(file)
+        file.close()
+
+        file = io.open("TimGM6mb.sf2", "rb")
+        data = file.read()
+        file.close()
+
+        self.assert_same_sound_font(expected, ms.SoundFont(data))
+        self.assert_same_sound_font(expected, ms.SoundFont(bytearray(data)))
+        self.assert_same_sound_font(expected, ms.SoundFont(memoryview(data)))
+
+    def test_truncated(self) -> None:
+
+        file = io.open("TimGM6mb.sf2", "rb")
+        data = file.read()
+        file.close()
+
+        # Cut inside the RIFF header, the sample data and the parameter chunks.
+        for length in [6, len(data) // 2, len(data) - 1]:
+            with self.assertRaises(Exception) as context:
+                ms.SoundFont(io.BytesIO(data[:length]))
+            self.assertIs(type(context.exception), Exception)
+            self.assertEqual(str(context.exception), "The data ended unexpectedly.")
+
+    def test_empty_sample_header_list(self) -> None:
+
+        headers = ms.SampleHeader._read_from_chunk(io.BytesIO(b""), 0)
+        self.assertEqual(len(headers), 0)
+
+    def test_from_file_empty(self) -> None:
+
+        # An empty file cannot be memory-mapped, so it is read as a stream instead.
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "empty.sf2")
+            io.open(path, "wb").close()
+
+            with self.assertRaisesRegex(Exception, "The RIFF chunk was not found."):
+                ms.SoundFont.from_file(path)
@@ -0,0 +1,149 @@
+# type: ignore
+
+import io
+import unittest
+
+from array import array
+
+import meltysynth as ms
+
+
+
+class TestSynthesizer(unittest.TestCase):
+
+    def test_pitch_bend_range_rpn(self) -> None:
+
+        file = io.open("TimGM6mb.sf2", "rb")
+        sf2 = ms.SoundFont(file)
+        file.close()
+
+        settings = ms.SynthesizerSettings(44100)
+        synthesizer = ms.Synthesizer(sf2, settings)
+
+        channel = synthesizer._channels[0]
+        self.assertAlmostEqual(channel.pitch_bend_range, 2.0)
+
+        # Select RPN 0 (pitch bend sensitivity), then set 12 semitones and 50 cents.
+        synthesizer.process_midi_message(0, 0xB0, 0x65, 0)
+        synthesizer.process_midi_message(0, 0xB0, 0x64, 0)
+        synthesizer.process_midi_message(0, 0xB0, 0x06, 12)
+        synthesizer.process_midi_message(0, 0xB0, 0x26, 50)
+        self.assertAlmostEqual(channel.pitch_bend_range, 12.5)
+
+        # Other channels are not affected.
+        self.assertAlmostEqual(synthesizer._channels[1].pitch_bend_range, 2.0)
+
+        # Data entry without a selected RPN does nothing.
+        synthesizer.process_midi_message(1, 0xB0, 0x06, 24)
+        self.assertAlmostEqual(synthesizer._channels[1].pitch_bend_range, 2.0)
+
+    def expected_region_pairs(self, preset, key, velocity):
+
+        # The regions selected by a linear scan over all the regions.
+        pairs = set()
+        for preset_region in preset.regions:
+            if preset_region.contains(key, velocity):
+                for instrument_region in preset_region.instrument.regions:
+                    if instrument_region.contains(key, velocity):
+                        pairs.add((preset_region, instrument_region))
+        return pairs
+
+    def test_note_on_region_lookup(self) -> None:
+
+        file = io.open("TimGM6mb.sf2", "rb")
+        sf2 = ms.SoundFont(file)
+        file.close()
+
+        settings = ms.SynthesizerSettings(44100)
+
+        for key in [0, 127, -1, 128, 255]:
+            synthesizer = ms.Synthesizer(sf2, settings)
+            preset = synthesizer._preset_lookup.get(0, synthesizer._default_preset)
+            expected = self.expected_region_pairs(preset, key, 100)
+
+            synthesizer.note_on(0, key, 100)
+            self.assertEqual(set(synthesizer._region_pairs), expected)
+
+    def test_note_on_region_lookup_out_of_range(self) -> None:
+
+        file = io.open("TimGM6mb.sf2", "rb")
+        sf2 = ms.SoundFont(file)
+        file.close()
+
+        settings = ms.SynthesizerSettings(44100)
+        synthesizer = ms.Synthesizer(sf2, settings)
+        preset = synthesizer._preset_lookup.get(0, synthesizer._default_preset)
+
+        # Key ranges can end above 127, which the per-key index does not cover.
+        for preset_region in preset.regions:
+            preset_region._gs[ms._GeneratorType.KEY_RANGE] |= 0xFF00
+            for instrument_region in preset_region.instrument.regions:
+                instrument_region._gs[ms._GeneratorType.KEY_RANGE] |= 0xFF00
+
+        expected = self.expected_region_pairs(preset, 200, 100)
+        self.assertNotEqual(len(expected), 0)
+
+        synthesizer.note_on(0, 200, 100)
+        self.assertEqual(set(synthesizer._region_pairs), expected)
+
+    def render_in_pieces(self, sf2, left, right) -> None:
+
+        settings = ms.SynthesizerSettings(44100)
+        synthesizer = ms.Synthesizer(sf2, settings)
+        synthesizer.note_on(0, 60, 100)
+        synthesizer.note_on(0, 64, 100)
+
+        # Pieces that do not line up with the block size.
+        offset = 0
+        for count in [1, 63, 64, 65, 200, 0, 607]:
+            synthesizer.render(left, right, offset, count)
+            offset += count
+
+    def test_render_buffer_types(self) -> None:
+
+        file = io.open("TimGM6mb.sf2", "rb")
+        sf2 = ms.SoundFont(file)
+        file.close()
+
+        length = 1000
+
+        list_left = [0.0] * length
+        list_right = [0.0] * length
+        self.render_in_pieces(sf2, list_left, list_right)
+
+        buffer_left = ms.create_buffer(length)
+        buffer_right = ms.create_buffer(length)
+        self.render_in_pieces(sf2, buffer_left, buffer_right)
+
+        float_left = array("f", bytes(4 * length))
+        float_right = array("f", bytes(4 * length))
+        self.render_in_pieces(sf2, float_left, float_right)
+
+        self.assertNotEqual(max(map(abs, list_left)), 0)
+        self.assertEqual(list(buffer_left), list_left)
+        self.assertEqual(list(buffer_right), list_right)
+        self.assertEqual(float_left, array("f", list_left))
+        self.assertEqual(float_right, array("f", list_right))
+
+    def test_render_out_of_range(self) -> None:
+
+        file = io.open("TimGM6mb.sf2", "rb")
+        sf2 = ms.SoundFont(file)
+        file.close()
+
+        settings = ms.SynthesizerSettings(44100)
+        synthesizer = ms.Synthesizer(sf2, settings)
+
+        buffers = [
+            ([0.0] * 100, [0.0] * 100),
+            (ms.create_buffer(100), ms.create_buffer(100)),
+            (array("f", bytes(400)), array("f", bytes(400))),
+        ]
+
+        for left, right in buffers:
+            with self.assertRaises(IndexError):
+                synthesizer.render(left, right, 90, 20)
+
+            # The buffers must not be resized.
+            self.assertEqual(len(left), 100)
+            self.assertEqual(len(right), 100)
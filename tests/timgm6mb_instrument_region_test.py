@@ -5410,3 +5410,25 @@ class TestInstrumentRegion(unittest.TestCase):
             for reg in range(len(instrument.regions)):
                 region: ms.InstrumentRegion = instrument.regions[reg]
                 RegionUtils.check_instrument_region(self, instrument, region, reference[ins][reg])
+
+    def test_undefined_sample_modes(self) -> None:
+
+        file = io.open("TimGM6mb.sf2", "rb")
+        sf2 = ms.SoundFont(file)
+        file.close()
+
+        # The unused value 2 and undefined values are loaded as no loop.
+        expected = {
+            0: ms.LoopMode.NO_LOOP,
+            1: ms.LoopMode.CONTINUOUS,
+            2: ms.LoopMode.NO_LOOP,
+            3: ms.LoopMode.LOOP_UNTIL_NOTE_OFF,
+            4: ms.LoopMode.NO_LOOP,
+            -1: ms.LoopMode.NO_LOOP,
+        }
+
+        instrument = sf2.instruments[0]
+        for sample_modes, loop_mode in expected.items():
+            zone = ms._Zone([ms._GeneratorType.SAMPLE_MODES], [sample_modes])
+            region = ms.InstrumentRegion(instrument, ms.InstrumentRegion._DEFAULT_GS, zone, sf2.sample_headers)
+            self.assertEqual(region.sample_modes, loop_mode)